@@ -1,10 +1,29 @@
 import os
+import json
+import hashlib
 import requests
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
 
 GITHUB_API_URL = "https://api.github.com"
-load_dotenv()
+USER_CACHE_FILE = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "git-recap",
+    "user.json",
+)
+
+_env_loaded = False
+_username_cache = {}
+
+def load_env():
+    """
+    Load variables from the .env file into the environment, once per process.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+    _env_loaded = True
 
 def authenticate():
     """
@@ -12,17 +31,63 @@ def authenticate():
     Returns:
         headers (dict): Authentication headers for GitHub API requests.
     """
+    load_env()
     token = os.getenv("GITHUB_TOKEN")
     if not token:
         raise ValueError("GitHub token not found. Set GITHUB_TOKEN in your .env file.")
     return {"Authorization": f"token {token}", "Accept": "application/vnd.github.v3+json"}
 
+def get_authenticated_username(cache_file=USER_CACHE_FILE):
+    """
+    Get the login of the user that owns GITHUB_TOKEN.
+    The result is cached in memory and in cache_file, keyed by a hash of the token,
+    so the /user request is only made once per token.
+    Args:
+        cache_file (str, optional): Path of the on-disk cache, or None to disable it.
+    Returns:
+        str: GitHub username, or None if it could not be fetched.
+    """
+    headers = authenticate()
+    key = hashlib.sha256(headers["Authorization"].encode("utf-8")).hexdigest()
+    if key in _username_cache:
+        return _username_cache[key]
+
+    cache = {}
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+    if key in cache:
+        _username_cache[key] = cache[key]
+        return cache[key]
+
+    response = requests.get(f"{GITHUB_API_URL}/user", headers=headers)
+    if response.status_code != 200:
+        print(f"Error fetching user info: {response.status_code}, {response.text}")
+        return None
+    username = response.json()["login"]
+    _username_cache[key] = username
+
+    if cache_file:
+        cache[key] = username
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+        except OSError as e:
+            print(f"Could not write user cache {cache_file}: {e}")
+    return username
+
 def get_time_range(start_date=None, end_date=None):
     """
     Get the time range for retrieving GitHub data.
     Defaults:
-        - Start Date: Last Sunday
-        - End Date: Next Sunday
+        - Start Date: Last Sunday, or six days before a given End Date
+        - End Date: Six days after Start Date
     Users can override:
         - Start Date (e.g., a specific past date)
         - End Date (e.g., today's date instead of next Sunday)
@@ -34,17 +99,19 @@ def get_time_range(start_date=None, end_date=None):
     Returns:
         tuple: (start_date, end_date) in YYYY-MM-DD format.
     """
+    if isinstance(start_date, str):
+        start_date = datetime.strptime(start_date, "%Y-%m-%d")
+    if isinstance(end_date, str):
+        end_date = datetime.strptime(end_date, "%Y-%m-%d")
+
     today = datetime.today()
+    if not start_date and end_date:
+        start_date = end_date - timedelta(days=6)
     if not start_date:
         start_date = today - timedelta(days=today.weekday() + 1)
     if not end_date:
         end_date = start_date + timedelta(days=6)
 
-    if isinstance(start_date, str):
-        start_date = datetime.strptime(start_date, "%Y-%m-%d")
-    if isinstance(end_date, str):
-        end_date = datetime.strptime(end_date, "%Y-%m-%d")
-
     return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
 
 def fetch_active_repositories(username, months=6):
@@ -1,65 +1,316 @@
-from fetch import *
-from format import *
-from ollama import *
-
-def main(optional_save=False):
-    headers = authenticate()
-    response = requests.get(f"{GITHUB_API_URL}/user", headers=headers)
-    if response.status_code != 200:
-        print(f"Error fetching user info: {response.status_code}, {response.text}")
-        return
-    user_info = response.json()
-    username = user_info["login"]
-    active_repos = fetch_active_repositories(username, months=6)
-    if not active_repos:
-        print("No active repositories found in the past 6 months.")
+import argparse
+import contextlib
+import json
+import sys
+from datetime import datetime
+
+# The fetch, format and ollama modules are imported inside the subcommands that
+# need them, so e.g. `render` never loads requests or dotenv.
+
+def parse_date(value):
+    """
+    argparse type for YYYY-MM-DD dates.
+    Args:
+        value (str): Date string from the command line.
+    Returns:
+        str: The same date string, once validated.
+    """
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date '{value}', expected YYYY-MM-DD.")
+    return value
+
+def parse_repo(value):
+    """
+    argparse type for owner/name repository identifiers.
+    Args:
+        value (str): Repository string from the command line.
+    Returns:
+        str: The same repository string, once validated.
+    """
+    owner, _, repo = value.partition("/")
+    if not owner or not repo or "/" in repo:
+        raise argparse.ArgumentTypeError(f"Invalid repository '{value}', expected owner/name.")
+    return value
+
+def positive_int(value):
+    """
+    argparse type for integers greater than zero.
+    Args:
+        value (str): Number from the command line.
+    Returns:
+        int: The parsed number.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"Invalid value '{value}', expected a positive integer.")
+    return number
+
+def read_input(path):
+    """
+    Read a file, or stdin when path is '-'.
+    """
+    if path == "-":
+        return sys.stdin.read()
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def write_output(content, path):
+    """
+    Write content to a file, or stdout when path is None or '-'.
+    """
+    if path in (None, "-"):
+        sys.stdout.write(content)
+        if not content.endswith("\n"):
+            sys.stdout.write("\n")
         return
-    
-    print("Repositories where you've been active in the past 6 months:")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    print(f"Output saved to {path}", file=sys.stderr)
+
+def select_repositories(active_repos, months=6):
+    """
+    Prompt the user to pick repositories from the list of active ones.
+    Args:
+        active_repos (list): Repository names to choose from.
+        months (int): Look-back window the repositories were found in.
+    Returns:
+        list: Selected repository names (empty on invalid input).
+    """
+    print(f"Repositories where you've been active in the past {months} months:")
     for idx, repo_name in enumerate(active_repos, start=1):
         print(f"{idx}. {repo_name}")
-    selected_indices = input("Enter the numbers of the repositories you want to fetch (comma-separated): ")
-    
+    try:
+        selected_indices = input("Enter the numbers of the repositories you want to fetch (comma-separated): ")
+    except EOFError:
+        print("\nNo input available. Pass --repo to select repositories non-interactively.")
+        return []
+
     try:
         selected_indices = [int(idx.strip()) - 1 for idx in selected_indices.split(",")]
     except ValueError:
         print("Invalid input. Please enter comma-separated numbers.")
-        return
-    
+        return []
+
     valid_indices = [idx for idx in selected_indices if 0 <= idx < len(active_repos)]
     if not valid_indices:
         print("No valid repositories selected.")
-        return
+    return [active_repos[idx] for idx in valid_indices]
+
+def collect_activity(args):
+    """
+    Fetch GitHub activity for the repositories and date range given in args.
+    Only the requests needed are made: /user is skipped when --user is given
+    (and cached otherwise), the events API is skipped when --repo is given.
+    Args:
+        args (argparse.Namespace): Parsed fetch/recap arguments.
+    Returns:
+        dict: Activity keyed by repository name, or None on failure,
+        including when any repository could not be fetched.
+    """
+    from fetch import get_authenticated_username, fetch_active_repositories, fetch_github_activity
+
+    repos = args.repo
+    try:
+        username = args.user or get_authenticated_username()
+        if not username:
+            return None
+        if not repos:
+            active_repos = fetch_active_repositories(username, months=args.months)
+            if not active_repos:
+                print(f"No active repositories found in the past {args.months} months.")
+                return None
+            repos = select_repositories(active_repos, args.months) if args.interactive else active_repos
+            if not repos:
+                return None
+    # requests' connection errors are OSError subclasses; a missing token is a ValueError.
+    except (OSError, ValueError) as e:
+        print(f"An error occurred: {e}")
+        return None
 
     all_activity = {}
-    for idx in valid_indices:
-        repo_name = active_repos[idx]
+    failed = []
+    for repo_name in repos:
         owner, repo = repo_name.split("/")
         print(f"\nFetching activity for repository: {repo_name}...")
         try:
-            activity = fetch_github_activity(owner, repo, username)
+            activity = fetch_github_activity(owner, repo, username, args.since, args.until)
             if activity:
                 all_activity[repo_name] = activity
         except Exception as e:
             print(f"Failed to fetch activity for {repo_name}: {e}")
+            failed.append(repo_name)
+    if failed:
+        print(f"Failed to fetch {len(failed)} of {len(repos)} repositories: {', '.join(failed)}")
+        return None
+    return all_activity
+
+def model_kwargs(args):
+    """
+    Keyword arguments for summarize_with_ollama, leaving its default model alone
+    unless --model was given.
+    """
+    return {"model_name": args.model} if args.model else {}
+
+def cmd_fetch(args):
+    """
+    Fetch activity and write it as JSON. Progress messages printed while
+    collecting are redirected to stderr so stdout only carries the JSON.
+    Args:
+        args (argparse.Namespace): Parsed fetch arguments.
+    Returns:
+        int: Process exit code.
+    """
+    with contextlib.redirect_stdout(sys.stderr):
+        all_activity = collect_activity(args)
+    if all_activity is None:
+        return 1
+    write_output(json.dumps(all_activity, indent=2), args.output)
+    return 0
+
+def cmd_render(args):
+    """
+    Render a JSON activity file (or stdin) as Markdown, without any network access.
+    Args:
+        args (argparse.Namespace): Parsed render arguments.
+    Returns:
+        int: Process exit code.
+    """
+    from format import format_activity_as_markdown
+
+    try:
+        all_activity = json.loads(read_input(args.input))
+    except (OSError, ValueError) as e:
+        print(f"Could not read activity from {args.input}: {e}", file=sys.stderr)
+        return 1
+    if not isinstance(all_activity, dict):
+        print(f"Could not read activity from {args.input}: expected a JSON object keyed by repository.", file=sys.stderr)
+        return 1
+    write_output(format_activity_as_markdown(all_activity), args.output)
+    return 0
+
+def cmd_summarize(args):
+    """
+    Summarize a Markdown activity report (or stdin) with Ollama.
+    Args:
+        args (argparse.Namespace): Parsed summarize arguments.
+    Returns:
+        int: Process exit code.
+    """
+    from ollama import summarize_with_ollama
+
+    try:
+        markdown_content = read_input(args.input)
+    except OSError as e:
+        print(e, file=sys.stderr)
+        return 1
+    try:
+        summary = summarize_with_ollama(markdown_content, **model_kwargs(args))
+    except Exception as e:
+        print(f"An error occurred: {e}", file=sys.stderr)
+        return 1
+    write_output(summary, args.output)
+    return 0
+
+def cmd_recap(args):
+    """
+    Fetch activity, format it as Markdown and summarize it with Ollama.
+    Progress messages printed while collecting and saving are redirected to
+    stderr so stdout only carries the summary.
+    Args:
+        args (argparse.Namespace): Parsed recap arguments.
+    Returns:
+        int: Process exit code.
+    """
+    with contextlib.redirect_stdout(sys.stderr):
+        all_activity = collect_activity(args)
+    if all_activity is None:
+        return 1
+
+    from format import format_activity_as_markdown, save_activity_as_markdown
+    from ollama import summarize_with_ollama
 
     markdown_content = format_activity_as_markdown(all_activity)
+    if args.save:
+        with contextlib.redirect_stdout(sys.stderr):
+            save_activity_as_markdown(all_activity, args.save)
 
-    if optional_save:
-        save_activity_as_markdown(all_activity)
-        try:
-            markdown_content = read_markdown_file("github_activity_summary.md")
-        except FileNotFoundError as e:
-            print(e)
-            return
-    
-    print("Generating weekly summary with Ollama...")
+    print("Generating weekly summary with Ollama...", file=sys.stderr)
     try:
-        summary = summarize_with_ollama(markdown_content)
-        print(summary)
+        summary = summarize_with_ollama(markdown_content, **model_kwargs(args))
     except Exception as e:
-        print(f"An error occurred: {e}")
+        print(f"An error occurred: {e}", file=sys.stderr)
+        return 1
+    write_output(summary, args.output)
+    return 0
+
+def add_fetch_arguments(parser):
+    """
+    Add the user, repository and date range options shared by fetch and recap.
+    Args:
+        parser (argparse.ArgumentParser): Subcommand parser to extend.
+    """
+    parser.add_argument("-u", "--user", help="GitHub username (default: owner of GITHUB_TOKEN, cached after the first lookup)")
+    parser.add_argument("-r", "--repo", action="append", type=parse_repo, metavar="OWNER/NAME",
+                        help="repository to fetch, can be repeated (default: all recently active repositories)")
+    parser.add_argument("--since", type=parse_date, metavar="YYYY-MM-DD", help="start date (default: last Sunday, or six days before --until)")
+    parser.add_argument("--until", type=parse_date, metavar="YYYY-MM-DD", help="end date (default: six days after start)")
+    parser.add_argument("--months", type=positive_int, default=6, help="look-back window for active repositories (default: 6)")
+    parser.add_argument("-i", "--interactive", action="store_true", help="pick repositories from a prompt when --repo is not given")
+
+def build_parser():
+    """
+    Build the command line parser with its fetch, render, summarize and recap subcommands.
+    """
+    parser = argparse.ArgumentParser(prog="git-recap", description="Summarize your GitHub activity.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    fetch_parser = subparsers.add_parser("fetch", help="fetch activity from GitHub as JSON")
+    add_fetch_arguments(fetch_parser)
+    fetch_parser.add_argument("-o", "--output", help="JSON output file (default: stdout)")
+    fetch_parser.set_defaults(func=cmd_fetch)
+
+    render_parser = subparsers.add_parser("render", help="render fetched JSON activity as Markdown")
+    render_parser.add_argument("input", nargs="?", default="-", help="JSON activity file (default: stdin)")
+    render_parser.add_argument("-o", "--output", help="Markdown output file (default: stdout)")
+    render_parser.set_defaults(func=cmd_render)
+
+    summarize_parser = subparsers.add_parser("summarize", help="summarize a Markdown activity report with Ollama")
+    summarize_parser.add_argument("input", nargs="?", default="-", help="Markdown file (default: stdin)")
+    summarize_parser.add_argument("-m", "--model", help="Ollama model (default: ollama.MODEL_NAME)")
+    summarize_parser.add_argument("-o", "--output", help="summary output file (default: stdout)")
+    summarize_parser.set_defaults(func=cmd_summarize)
+
+    recap_parser = subparsers.add_parser("recap", help="fetch, render and summarize in one go")
+    add_fetch_arguments(recap_parser)
+    recap_parser.add_argument("-m", "--model", help="Ollama model (default: ollama.MODEL_NAME)")
+    recap_parser.add_argument("-s", "--save", metavar="FILE", help="also save the Markdown activity report to FILE")
+    recap_parser.add_argument("-o", "--output", help="summary output file (default: stdout)")
+    recap_parser.set_defaults(func=cmd_recap)
+
+    return parser
+
+def main(argv=None):
+    """
+    Command line entry point. Without a subcommand, runs an interactive recap.
+    Args:
+        argv (list, optional): Arguments to parse instead of sys.argv[1:].
+    Returns:
+        int: Process exit code.
+    """
+    parser = build_parser()
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv:
+        argv = ["recap", "--interactive"]
+    args = parser.parse_args(argv)
+    if getattr(args, "since", None) and getattr(args, "until", None) and args.since > args.until:
+        parser.error(f"--since {args.since} is after --until {args.until}.")
+    return args.func(args)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
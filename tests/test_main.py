@@ -0,0 +1,198 @@
+import io
+import json
+import fetch
+import sys
+import main
+import pytest
+from unittest.mock import patch
+
+ACTIVITY = {
+    "commits": [{"message": "Test commit message", "date": "2025-03-01T12:00:00Z"}],
+    "pull_requests": [],
+    "reviews": {},
+    "issues": []
+}
+
+# ======================
+# 1. Test argument parsing
+# ======================
+def test_invalid_date_rejected():
+    """Test that malformed --since dates are rejected by the parser."""
+    with pytest.raises(SystemExit):
+        main.main(["fetch", "--since", "2025-13-01"])
+
+
+def test_invalid_repo_rejected():
+    """Test that --repo must be in owner/name form."""
+    with pytest.raises(SystemExit):
+        main.main(["fetch", "--repo", "just_a_name"])
+
+
+def test_inverted_date_range_rejected():
+    """Test that --since after --until is rejected by the parser."""
+    with pytest.raises(SystemExit):
+        main.main(["fetch", "--since", "2025-03-10", "--until", "2025-03-01"])
+
+
+def test_non_positive_months_rejected():
+    """Test that --months must be a positive integer."""
+    with pytest.raises(SystemExit):
+        main.main(["fetch", "--months", "0"])
+
+
+# ======================
+# 2. Test fetch subcommand
+# ======================
+@patch("fetch.fetch_github_activity")
+@patch("fetch.fetch_active_repositories")
+@patch("fetch.get_authenticated_username")
+def test_fetch_with_user_and_repo_skips_lookups(mock_username, mock_active, mock_activity, tmp_path):
+    """Test that --user and --repo avoid the /user and events API calls."""
+    mock_activity.return_value = ACTIVITY
+    output = tmp_path / "activity.json"
+
+    assert main.main(["fetch", "--user", "test_user", "--repo", "test_owner/test_repo",
+                      "--since", "2025-03-01", "--until", "2025-03-10", "-o", str(output)]) == 0
+    mock_username.assert_not_called()
+    mock_active.assert_not_called()
+    mock_activity.assert_called_once_with("test_owner", "test_repo", "test_user", "2025-03-01", "2025-03-10")
+    assert json.loads(output.read_text()) == {"test_owner/test_repo": ACTIVITY}
+
+
+@patch("fetch.fetch_github_activity")
+@patch("fetch.fetch_active_repositories")
+@patch("fetch.get_authenticated_username")
+def test_fetch_defaults_to_active_repositories(mock_username, mock_active, mock_activity, tmp_path):
+    """Test that fetch without --repo uses every active repository, without prompting."""
+    mock_username.return_value = "test_user"
+    mock_active.return_value = ["test_owner/repo_a", "test_owner/repo_b"]
+    mock_activity.return_value = ACTIVITY
+    output = tmp_path / "activity.json"
+
+    with patch("builtins.input", side_effect=AssertionError("should not prompt")):
+        assert main.main(["fetch", "-o", str(output)]) == 0
+    assert sorted(json.loads(output.read_text())) == ["test_owner/repo_a", "test_owner/repo_b"]
+
+
+@patch("fetch.fetch_github_activity")
+def test_fetch_fails_when_repo_fetch_fails(mock_activity, tmp_path, capsys):
+    """Test that fetch exits non-zero and writes nothing when a repository fetch fails."""
+    mock_activity.side_effect = ValueError("GitHub token not found. Set GITHUB_TOKEN in your .env file.")
+    output = tmp_path / "activity.json"
+
+    assert main.main(["fetch", "--user", "test_user", "--repo", "test_owner/test_repo", "-o", str(output)]) == 1
+    assert not output.exists()
+    assert capsys.readouterr().out == ""
+
+
+@patch("fetch.get_authenticated_username")
+def test_fetch_missing_token(mock_username, capsys):
+    """Test that a missing token is reported on stderr instead of raising."""
+    mock_username.side_effect = ValueError("GitHub token not found. Set GITHUB_TOKEN in your .env file.")
+
+    assert main.main(["fetch", "--repo", "test_owner/test_repo"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "GitHub token not found" in captured.err
+
+
+@patch("fetch.fetch_github_activity")
+def test_fetch_until_only(mock_activity, tmp_path):
+    """Test that --until alone ends a week-long range instead of inverting it."""
+    mock_activity.return_value = ACTIVITY
+    output = tmp_path / "activity.json"
+
+    assert main.main(["fetch", "--user", "test_user", "--repo", "test_owner/test_repo",
+                      "--until", "2020-01-07", "-o", str(output)]) == 0
+    owner, repo, username, start_date, end_date = mock_activity.call_args.args
+    assert fetch.get_time_range(start_date, end_date) == ("2020-01-01", "2020-01-07")
+
+
+@patch("fetch.fetch_active_repositories")
+@patch("fetch.get_authenticated_username")
+def test_interactive_without_stdin(mock_username, mock_active, monkeypatch):
+    """Test that the default interactive recap exits cleanly when stdin is empty."""
+    mock_username.return_value = "test_user"
+    mock_active.return_value = ["test_owner/test_repo"]
+    monkeypatch.setattr("sys.stdin", io.StringIO(""))
+
+    assert main.main([]) == 1
+
+
+# ======================
+# 3. Test render subcommand
+# ======================
+def test_render_does_not_load_network_modules(tmp_path):
+    """Test that render formats JSON activity without importing fetch or ollama."""
+    source = tmp_path / "activity.json"
+    source.write_text(json.dumps({"test_owner/test_repo": ACTIVITY}))
+    output = tmp_path / "activity.md"
+
+    with patch.dict(sys.modules):
+        sys.modules.pop("fetch", None)
+        sys.modules.pop("ollama", None)
+        assert main.main(["render", str(source), "-o", str(output)]) == 0
+        assert "fetch" not in sys.modules
+        assert "ollama" not in sys.modules
+    assert "## Repository: test_owner/test_repo" in output.read_text()
+    assert "Test commit message" in output.read_text()
+
+
+def test_render_rejects_non_object_json(tmp_path, capsys):
+    """Test that render reports JSON that is not an object keyed by repository."""
+    source = tmp_path / "activity.json"
+    source.write_text("[1]")
+
+    assert main.main(["render", str(source)]) == 1
+    assert "expected a JSON object" in capsys.readouterr().err
+
+
+def test_render_directory_input(tmp_path, capsys):
+    """Test that render reports unreadable input instead of raising."""
+    assert main.main(["render", str(tmp_path)]) == 1
+    assert "Could not read activity" in capsys.readouterr().err
+
+
+# ======================
+# 4. Test summarize subcommand
+# ======================
+@patch("ollama.summarize_with_ollama")
+def test_summarize_with_model(mock_summarize, tmp_path):
+    """Test that summarize passes the report and --model through to Ollama."""
+    mock_summarize.return_value = "Weekly summary"
+    source = tmp_path / "activity.md"
+    source.write_text("# GitHub Activity Summary\n")
+    output = tmp_path / "summary.txt"
+
+    assert main.main(["summarize", str(source), "--model", "test_model", "-o", str(output)]) == 0
+    mock_summarize.assert_called_once_with("# GitHub Activity Summary\n", model_name="test_model")
+    assert output.read_text() == "Weekly summary"
+
+
+# ======================
+# 5. Test recap subcommand
+# ======================
+@patch("ollama.summarize_with_ollama")
+@patch("fetch.fetch_github_activity")
+def test_recap_save_and_output(mock_activity, mock_summarize, tmp_path):
+    """Test that recap saves the Markdown report with --save and writes the summary to -o."""
+    mock_activity.return_value = ACTIVITY
+    mock_summarize.return_value = "Weekly summary"
+    report = tmp_path / "activity.md"
+    output = tmp_path / "summary.txt"
+
+    assert main.main(["recap", "--user", "test_user", "--repo", "test_owner/test_repo",
+                      "--save", str(report), "-o", str(output)]) == 0
+    assert "Test commit message" in report.read_text()
+    assert "Test commit message" in mock_summarize.call_args.args[0]
+    assert output.read_text() == "Weekly summary"
+
+
+@patch("ollama.summarize_with_ollama")
+@patch("fetch.fetch_github_activity")
+def test_recap_skips_ollama_when_fetch_fails(mock_activity, mock_summarize):
+    """Test that recap does not summarize an empty report when fetching fails."""
+    mock_activity.side_effect = ValueError("GitHub token not found.")
+
+    assert main.main(["recap", "--user", "test_user", "--repo", "test_owner/test_repo"]) == 1
+    mock_summarize.assert_not_called()